@@ -0,0 +1,57 @@
+import pygame
+
+class BitmapFont:
+    """
+    Font whose glyphs are rendered only once onto an atlas surface, so that rendering a text
+    only requires blitting the glyphs from the atlas.
+
+    Attributes:
+    - atlas: pygame surface holding the rendered glyphs side by side
+    - glyphs: dict mapping each character to its rect in the atlas
+    - height: int representing the height of the glyphs
+
+    Constants:
+    - CHARACTERS: str with the characters rendered in the atlas (printable ASCII)
+    - FALLBACK: str representing the character used for the characters not in the atlas
+    """
+    CHARACTERS = ''.join(chr(code) for code in range(32, 127))
+    FALLBACK = '?'
+
+    def __init__(self, font:pygame.font.Font, color:tuple, background:tuple):
+        widths = [font.size(char)[0] for char in BitmapFont.CHARACTERS]
+        self.height = font.get_height()
+
+        # The glyphs are rendered on an opaque background, so that blitting them is a plain copy
+        self.atlas = pygame.Surface((sum(widths), self.height)).convert()
+        self.atlas.fill(background)
+
+        self.glyphs = {}
+        x = 0
+        for char, width in zip(BitmapFont.CHARACTERS, widths):
+            self.atlas.blit(font.render(char, True, color, background), (x, 0))
+            self.glyphs[char] = pygame.Rect(x, 0, width, self.height)
+            x += width
+
+    def render(self, text:str) -> pygame.Surface:
+        """
+        Render a text by copying its glyphs from the atlas.
+
+        Parameters:
+        - text: str representing the text to render
+
+        Returns:
+        - pygame.Surface: the rendered text
+        """
+        fallback = self.glyphs[BitmapFont.FALLBACK]
+        glyphs = [self.glyphs.get(char, fallback) for char in text]
+
+        surface = pygame.Surface((sum(glyph.width for glyph in glyphs), self.height)).convert()
+
+        blit_sequence = []
+        x = 0
+        for glyph in glyphs:
+            blit_sequence.append((self.atlas, (x, 0), glyph))
+            x += glyph.width
+        surface.blits(blit_sequence, doreturn=False)
+
+        return surface
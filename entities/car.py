@@ -22,11 +22,14 @@ class Car:
     - SPEED: int representing the speed of the car
     - WIDTH: int representing the width of the car
     - LENGTH: int representing the length of the car
+    - label_font: pygame font shared by the waiting time labels of all the cars
     """
     SPEED = 4
     WIDTH = 20
     LENGTH = 40
 
+    label_font = None
+
     def __init__(self, window, direction:list = None):
         self.window = window
         self.window_width = self.window.get_width()
@@ -109,14 +112,40 @@ class Car:
         elif self.direction == CarActions.RIGHT:
             self.x += Car.SPEED
 
+    @classmethod
+    def load_label_font(cls):
+        """
+        Create the font of the waiting time labels.
+
+        It must be called after pygame.font is (re)initialized, since a font does not survive pygame.quit().
+        """
+        cls.label_font = pygame.font.Font(None, 20)   # font size for waiting time
+
     def draw(self):
         """
         Draw the car on the window.
         """
+        self.draw_body()
+        self.window.blit(*self.get_blit_args())
+
+    def draw_body(self):
+        """
+        Draw the car on the window, without the waiting time label.
+
+        Used to draw many cars at once: the labels are then blitted together using get_blit_args.
+        """
         pygame.draw.rect(self.window, self.color, self._generate_car_rect())
 
         self._draw_turn_signal()
-        self._draw_waiting_time()
+
+    def get_blit_args(self) -> tuple:
+        """
+        Get the surface and the destination of the waiting time label of the car.
+
+        Returns:
+            tuple: The rendered waiting time and its position in the window.
+        """
+        return self._render_waiting_time(), (self.x + 5, self.y + 5)
 
     def _generate_car_rect(self):
         """
@@ -157,14 +186,17 @@ class Car:
         else:  # self.direction == 'right'
             return [(self.x + Car.LENGTH, self.y + Car.WIDTH), (self.x + Car.LENGTH - 10, self.y + Car.WIDTH ), (self.x + Car.LENGTH + 5, self.y + Car.WIDTH + 5), (self.x + Car.LENGTH - 15, self.y + Car.WIDTH + 5)]
 
-    def _draw_waiting_time(self):
+    def _render_waiting_time(self):
         """
-        Draws the waiting time of the car, displayed in the top-left corner of the car.
+        Renders the waiting time of the car, displayed in the top-left corner of the car.
+
+        Returns:
+            pygame.Surface: The rotated waiting time text.
         """
-        font = pygame.font.Font(None, 20)   # font size for waiting time
-        text = font.render(str(self.get_waiting_time() // 30), True, (255, 255, 255))
-        text = pygame.transform.rotate(text, 90)
-        self.window.blit(text, (self.x + 5, self.y + 5))
+        if Car.label_font is None:
+            Car.load_label_font()
+        text = Car.label_font.render(str(self.get_waiting_time() // 30), True, (255, 255, 255))
+        return pygame.transform.rotate(text, 90)
 
     def can_move(self, other_cars: list) -> bool:
         """
@@ -18,6 +18,9 @@ class CarManager:
     def __init__(self, window):
             self.window = window
 
+            # The font is created for every simulation, pygame may have been re-initialized
+            Car.load_label_font()
+
             self.cars = []
             
             self.cumulative_waiting_time = 0
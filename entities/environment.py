@@ -1,11 +1,15 @@
 import pygame
 import os
+from entities.bitmap_font import BitmapFont
 
 # Colors
 WHITE = (255, 255, 255)
 GRAY = (128, 128, 128)
+PANEL_COLOR = (30, 30, 30)
 
 AMBIENT_IMAGES_PATH = './assets/img/'
+# Ambient images in drawing order: top-left, top-right, bottom-right, bottom-left
+AMBIENT_IMAGE_FILES = ('ambient_1.png', 'ambient_2.png', 'ambient_3.png', 'ambient_4.png')
 AUDIO_PATH = './assets/audio/street_sound_effect.mp3'
 
 class Environment:
@@ -18,31 +22,66 @@ class Environment:
     - window_height: int representing the height of the window
     - ambient_images: list of pygame images representing the images of the environment
     - audio: bool representing if the audio is enabled
+    - headless: bool representing if the environment runs without rendering (e.g. for batch MDP runs),
+      in which case the images and the pre-rendered surfaces below are not created
+    - _cx: int representing the x coordinate of the center of the window
+    - _cy: int representing the y coordinate of the center of the window
+    - _static_lines: tuple of (color, start, end, width) of the lines of the road, in drawing order
+    - _background: pygame surface holding the pre-rendered static environment
+    - _panel_font: BitmapFont used by the info panel
+    - _text_cache: dict mapping (field, value) to the rendered text surface of the info panel
+    - _panel_cache_key: tuple with the inputs of the last rendered info panel
+    - _panel_surface: pygame surface holding the last rendered info panel, reused across renders
     
     Constants:
     - AMBIENT_IMAGES_PATH: str representing the path to the images
+    - AMBIENT_IMAGE_FILES: tuple of the image file names, in drawing order
     - AUDIO_PATH: str representing the path to the audio
 
     Raises:
     - AssertionError: If the window size is not greater than 0
     - AssertionError: If the name is not a valid string
     """
-    def __init__(self, window_size:int, name:str, audio:bool = False):
+    def __init__(self, window_size:int, name:str, audio:bool = False, headless:bool = False):
         
         assert window_size[0] > 0 and window_size[1] > 0, "Window size must be greater than 0"
         assert name, "Name for the simulation must be a valid string"
 
         self.window = None
-        self._pygame_init(window_size, name, audio=audio)
+        self.headless = headless
+        self._pygame_init(window_size, name, audio=audio, headless=headless)
 
+        self.window_width = self.window.get_width()
+        self.window_height = self.window.get_height()
+        # Center of the intersection
+        self._cx = self.window_width // 2
+        self._cy = self.window_height // 2
+
+        if headless:
+            # Nothing is shown: no rendering resources are created and the drawing methods do nothing
+            for method in ('draw', '_blit_images', '_draw_lines', 'draw_cars', 'draw_info_panel', 'update'):
+                setattr(self, method, lambda *args, **kwargs: None)
+        else:
+            self._init_rendering()
+
+    def _init_rendering(self) -> None:
+        """
+        Load the images and pre-render the static surfaces used to draw the environment.
+        """
         self.ambient_images = self._resize_images(
             self._load_pygame_images(
-                [os.path.join(AMBIENT_IMAGES_PATH, image) for image in os.listdir(AMBIENT_IMAGES_PATH)]
+                [os.path.join(AMBIENT_IMAGES_PATH, image) for image in AMBIENT_IMAGE_FILES]
             )
         )
 
-        self.window_width = self.window.get_width()
-        self.window_height = self.window.get_height()
+        self._static_lines = self._compute_static_lines()
+
+        self._background = self._render_background()
+
+        self._panel_font = BitmapFont(pygame.font.SysFont(None, 24), WHITE, PANEL_COLOR)
+        self._text_cache = {}
+        self._panel_cache_key = None
+        self._panel_surface = pygame.Surface((300, 160)).convert()
 
     def close(self):
         pygame.quit()
@@ -53,7 +92,7 @@ class Environment:
     def get_window(self):
         return self.window
 
-    def _pygame_init(self, window_size:tuple, name:str, audio:bool) -> None:
+    def _pygame_init(self, window_size:tuple, name:str, audio:bool, headless:bool) -> None:
         """
         Initialize pygame and the window.
 
@@ -61,8 +100,21 @@ class Environment:
         - window_size: tuple representing the size of the window
         - name: str representing the name of the window
         - audio: bool representing if the audio is enabled
+        - headless: bool representing if the window is created on the dummy video driver, without being shown
         """
-        pygame.init()
+        # Only the needed subsystems are initialized, the mixer is started only if the audio is enabled
+        if headless:
+            # Select the dummy driver only for this initialization, so that later environments can open a window
+            video_driver = os.environ.get('SDL_VIDEODRIVER')
+            os.environ['SDL_VIDEODRIVER'] = 'dummy'
+            pygame.display.init()
+            if video_driver is None:
+                os.environ.pop('SDL_VIDEODRIVER')
+            else:
+                os.environ['SDL_VIDEODRIVER'] = video_driver
+        else:
+            pygame.display.init()
+        pygame.font.init()
         pygame.display.set_caption(name)
         self.window = pygame.display.set_mode(window_size)
 
@@ -80,9 +132,10 @@ class Environment:
         - ambient_images_path: list of paths to the images
 
         Returns:
-        - list: list of pygame images
+        - list: list of pygame images, converted to the pixel format of the window
         """
-        return [pygame.image.load(image_path) for image_path in ambient_images_path]
+        # The images are RGBA PNGs, so the alpha channel is kept
+        return [pygame.image.load(image_path).convert_alpha() for image_path in ambient_images_path]
 
     def _resize_images(self, ambient_images:list) -> list:
         """
@@ -91,48 +144,84 @@ class Environment:
         Parameters:
         - ambient_images: list of pygame images
         """
-        window_width = self.window.get_width()
-        window_height = self.window.get_height()
-        return [pygame.transform.scale(image, (window_width // 2 - 30, window_height // 2 - 30)) for image in ambient_images]
+        size = (self.window_width // 2 - 30, self.window_height // 2 - 30)
+        return [pygame.transform.scale(image, size) for image in ambient_images]
 
-    def draw(self):
+    def _render_background(self) -> pygame.Surface:
         """
-        Draw the environment.
+        Pre-render the static part of the environment (images and lines) onto a single surface.
+
+        Returns:
+        - pygame.Surface: surface holding the composed background
         """
+        background = pygame.Surface((self.window_width, self.window_height)).convert()
+
+        # Temporarily draw onto the background instead of the window
+        window, self.window = self.window, background
         self._blit_images()
         self._draw_lines()
+        self.window = window
+
+        return background
+
+    def draw(self):
+        """
+        Draw the environment.
+        """
+        self.window.blit(self._background, (0, 0))
+
+    def _compute_static_lines(self) -> tuple:
+        """
+        Compute the lines of the road: intersection, lanes and crosswalk stripes.
+
+        Returns:
+        - tuple: tuple of (color, start, end, width) tuples, in drawing order
+        """
+        w, h = self.window_width, self.window_height
+        cx, cy = self._cx, self._cy
+        # Intersection
+        lines = [
+            (GRAY, (0, cy), (w, cy), 60),
+            (GRAY, (cx, 0), (cx, h), 60),
+        ]
+        # Lanes
+        for offset in [-28, 28]:
+            lines.append((WHITE, (0, cy + offset), (w, cy + offset), 1))
+            lines.append((WHITE, (cx + offset, 0), (cx + offset, h), 1))
+        lines.append((WHITE, (0, cy), (w, cy), 4))
+        lines.append((WHITE, (cx, 0), (cx, h), 4))
+        # Crosswalks
+        crosswalk_offsets = [-23, -17, -12, -6, 6, 12, 17, 23]
+        for offset in crosswalk_offsets:
+            lines.append((WHITE, (cx + offset, cy - 200), (cx + offset, cy - 180), 2))
+            lines.append((WHITE, (cx + offset, cy + 200), (cx + offset, cy + 220), 2))
+            lines.append((WHITE, (cx - 200, cy + offset), (cx - 180, cy + offset), 2))
+            lines.append((WHITE, (cx + 180, cy + offset), (cx + 200, cy + offset), 2))
+        return tuple(lines)
 
     def _blit_images(self):
         """
         Blit the images of the environment.
         """
-        self.window.blit(self.ambient_images[0], (0, 0))
-        self.window.blit(self.ambient_images[1], (self.window_width // 2 + 30, 0))
-        self.window.blit(self.ambient_images[2], (self.window_width // 2 + 30, self.window_height // 2 + 30))
-        self.window.blit(self.ambient_images[3], (0, self.window_height // 2 + 30))
+        blit = self.window.blit
+        images = self.ambient_images
+        cx, cy = self._cx, self._cy
+        blit(images[0], (0, 0))
+        blit(images[1], (cx + 30, 0))
+        blit(images[2], (cx + 30, cy + 30))
+        blit(images[3], (0, cy + 30))
 
     def _draw_lines(self):
         """
         Draw the lines of the environment.
         """
-        # Draw intersection
-        pygame.draw.line(self.window, GRAY, (0, self.window_height // 2), (self.window_width, self.window_height // 2), 60)
-        pygame.draw.line(self.window, GRAY, (self.window_width // 2, 0), (self.window_width // 2, self.window_height), 60)
-        # Draw lanes
-        for offset in [-28, 28]:
-            pygame.draw.line(self.window, WHITE, (0, self.window_height // 2 + offset), (self.window_width, self.window_height // 2 + offset), 1)
-            pygame.draw.line(self.window, WHITE, (self.window_width // 2 + offset, 0), (self.window_width // 2 + offset, self.window_height), 1)
-        pygame.draw.line(self.window, WHITE, (0, self.window_height // 2), (self.window_width, self.window_height // 2), 4)
-        pygame.draw.line(self.window, WHITE, (self.window_width // 2, 0), (self.window_width // 2, self.window_height), 4)
-        # Draw crosswalks
-        crosswalk_offsets = [-23, -17, -12, -6, 6, 12, 17, 23]
-        for offset in crosswalk_offsets:
-            pygame.draw.line(self.window, WHITE, (self.window_width // 2 + offset, self.window_height // 2 - 200), (self.window_width // 2 + offset, self.window_height // 2 - 180), 2)
-            pygame.draw.line(self.window, WHITE, (self.window_width // 2 + offset, self.window_height // 2 + 200), (self.window_width // 2 + offset, self.window_height // 2 + 220), 2)
-            pygame.draw.line(self.window, WHITE, (self.window_width // 2 - 200, self.window_height // 2 + offset), (self.window_width // 2 - 180, self.window_height // 2 + offset), 2)
-            pygame.draw.line(self.window, WHITE, (self.window_width // 2 + 180, self.window_height // 2 + offset), (self.window_width // 2 + 200, self.window_height // 2 + offset), 2)
+        # Bind the lookups shared by all the lines (this only runs once, to build the background)
+        line = pygame.draw.line
+        window = self.window
+        for color, start, end, width in self._static_lines:
+            line(window, color, start, end, width)
         # Cover intersection
-        pygame.draw.rect(self.window, GRAY, (self.window_width // 2 - 29, self.window_height // 2 - 29, 60, 60))
+        pygame.draw.rect(window, GRAY, (self._cx - 29, self._cy - 29, 60, 60))
 
     def draw_cars(self, car_manager):
         """
@@ -141,7 +230,11 @@ class Environment:
         Parameters:
         - car_manager: car_manager object
         """
-        [car.draw() for car in car_manager.get_cars()]
+        cars = car_manager.get_cars()
+        for car in cars:
+            car.draw_body()
+        # Blit all the waiting time labels at once, on top of all the cars
+        self.window.blits([car.get_blit_args() for car in cars], doreturn=False)
 
     def draw_info_panel(self,
             total_seconds:int, 
@@ -157,26 +250,51 @@ class Environment:
         - cumulative_waiting_time: int representing the cumulative waiting time of the cars.
         - mode: str representing the mode of the simulation
         """ 
-        font = pygame.font.SysFont(None, 24)
-        panel_color = (30, 30, 30)
-        text_color = (255, 255, 255)
+        # Reuse the last panel if nothing changed since the previous frame
+        key = (total_seconds, interval, cumulative_waiting_time, mode)
+        if key == self._panel_cache_key:
+            self.window.blit(self._panel_surface, (10, 10))
+            return
 
-        # Create a surface for the panel
-        panel_surface = pygame.Surface((300, 160))
-        panel_surface.fill(panel_color)
+        # Clear the panel surface
+        panel_surface = self._panel_surface
+        panel_surface.fill(PANEL_COLOR)
         
-        # Render the text
-        elapsed_time_text = font.render(f"Elapsed Time: {total_seconds} sec", True, text_color)
-        interval_text = font.render(f"Spawning rule: {interval}", True, text_color)
-        cumulative_waiting_time_text = font.render(f"Cumulative Waitings: {cumulative_waiting_time} sec", True, text_color)
-        mode_text = font.render(f"Running mode: {'fixed time' if mode == 'ft' else 'policy iteration' if mode == 'pi' else 'value iteration'}", True, text_color)
+        # Render the text (only the fields whose value changed are rendered again)
+        elapsed_time_text = self._render_text("elapsed", total_seconds, f"Elapsed Time: {total_seconds} sec")
+        interval_text = self._render_text("interval", interval, f"Spawning rule: {interval}")
+        cumulative_waiting_time_text = self._render_text("cumulative", cumulative_waiting_time, f"Cumulative Waitings: {cumulative_waiting_time} sec")
+        mode_text = self._render_text("mode", mode, f"Running mode: {'fixed time' if mode == 'ft' else 'policy iteration' if mode == 'pi' else 'value iteration'}")
 
         # Blit the text onto the panel surface
         panel_surface.blit(elapsed_time_text, (10, 10))
         panel_surface.blit(interval_text, (10, 40))
         panel_surface.blit(mode_text, (10, 70))
         panel_surface.blit(cumulative_waiting_time_text, (10, 100))
+
+        self._panel_cache_key = key
         
         # Blit the panel surface onto the window
         self.window.blit(panel_surface, (10, 10))
 
+    def _render_text(self, field:str, value, text:str) -> pygame.Surface:
+        """
+        Render a line of the information panel, reusing the cached surface if the value did not change.
+
+        Parameters:
+        - field: str representing the name of the panel field
+        - value: value displayed by the field
+        - text: str representing the text to render
+
+        Returns:
+        - pygame.Surface: the rendered text
+        """
+        key = (field, value)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Evict the stale entry of this field, so that the cache holds one surface per field
+            for cached_key in [cached_key for cached_key in self._text_cache if cached_key[0] == field]:
+                self._text_cache.pop(cached_key)
+            surface = self._panel_font.render(text)
+            self._text_cache[key] = surface
+        return surface
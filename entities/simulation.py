@@ -2,6 +2,7 @@ import pygame
 from entities.environment import Environment
 from entities.car_manager import CarManager
 from entities.stoplight_manager import StoplightManager
+from entities.stoplight import Stoplight
 from model.TrafficMDP import TrafficMDP
 from entities.colors import TrafficLightColor
 from entities.car_actions import CarActions
@@ -14,15 +15,17 @@ class Simulation:
     - spawning_rules: list of tuples with the duration of each interval
     - car_spawn_rate: float representing the spawn rate of cars in seconds
     - audio: bool representing if the audio is enabled
+    - headless: bool representing if the simulation runs without rendering
     - simulation_duration: int representing the total duration of the simulation
     - intervals: list of tuples with the duration of each interval
     """
-    def __init__(self, spawning_rules:list, car_spawn_rate:float = 1, audio:bool = False) -> None:
+    def __init__(self, spawning_rules:list, car_spawn_rate:float = 1, audio:bool = False, headless:bool = False) -> None:
         self.car_spawn_frequency = car_spawn_rate
         self.car_spwan_policy = spawning_rules
         self.simulation_duration = self._get_total_time(spawning_rules)
         self.intervals = spawning_rules
         self.audio = audio
+        self.headless = headless
 
         print(f"Simulation duration: {self.simulation_duration} seconds")
 
@@ -58,7 +61,8 @@ class Simulation:
         self.environment = Environment(
             window_size=(1000, 1000),
             name=f'Simulation with {mode} mode',
-            audio=self.audio
+            audio=self.audio,
+            headless=self.headless
         )
 
         self.window = self.environment.get_window()
@@ -72,6 +76,9 @@ class Simulation:
         prev_time = 0
         clock = pygame.time.Clock()
         total_seconds = 0
+        # The environment does not call pygame.init(), so the SDL timer is started by the first tick of the clock:
+        # the start ticks must be read after it, otherwise they are 0 and the setup time counts as elapsed time
+        clock.tick()
         start_ticks = pygame.time.get_ticks()  # Get the start ticks
 
 
@@ -80,7 +87,8 @@ class Simulation:
 
             # Draw the environment:
             self.environment.draw()
-            self.stoplight_manager.draw_stoplight(self.window)
+            if not self.headless:
+                self.stoplight_manager.draw_stoplight(self.window)
 
             # Update the stoplight:
             self.stoplight_manager.update_stoplight()
@@ -138,7 +146,7 @@ class Simulation:
                 # Case Fixed Time
                 case 'ft':
                     # Switch the stoplight to yellow if the stoplight has been green for 7 seconds
-                    self.stoplight_manager.stoplight.switch_yellow() if self.stoplight_manager.stoplight.time_green//30 >= 20 else None
+                    self.stoplight_manager.stoplight.switch_yellow() if self.stoplight_manager.stoplight.time_green >= Stoplight.GREEN_DURATION else None
                 # Default case
                 case _:
                     raise ValueError(f"Mode: {mode} not yet implemented")
@@ -1,12 +1,58 @@
 #!/usr/bin/env python
 
 from entities.colors import TrafficLightColor
+from functools import lru_cache
+from numbers import Integral
 import random
 
+# Color values bound once, to avoid resolving the enum members on every tick
+_GREEN = TrafficLightColor.GREEN.value
+_YELLOW = TrafficLightColor.YELLOW.value
+_RED = TrafficLightColor.RED.value
+
+# Phases of the stoplight: 0 = NS green, 1 = NS yellow, 2 = EW green, 3 = EW yellow
+_NS_GREEN, _NS_YELLOW, _EW_GREEN, _EW_YELLOW = range(4)
+# Colors of each direction, indexed by phase
+_NS_COLORS = (_GREEN, _YELLOW, _RED, _RED)
+_EW_COLORS = (_RED, _RED, _GREEN, _YELLOW)
+# Phase following each phase
+_NEXT_PHASE = (_NS_YELLOW, _EW_GREEN, _EW_YELLOW, _NS_GREEN)
+_YELLOW_PHASES = (_NS_YELLOW, _EW_YELLOW)
+
+# Durations in ticks of the phases when the stoplight runs with fixed time
+_GREEN_DURATION = 600
+_YELLOW_DURATION = 90
+_PHASE_DURATIONS = (_GREEN_DURATION, _YELLOW_DURATION, _GREEN_DURATION, _YELLOW_DURATION)
+# Tick of the fixed time cycle at which each phase starts
+_PHASE_STARTS = tuple(sum(_PHASE_DURATIONS[:phase]) for phase in range(4))
+# Phase at each tick of the fixed time cycle
+_PHASE_SCHEDULE = tuple(phase for phase, duration in enumerate(_PHASE_DURATIONS) for _ in range(duration))
+_PERIOD = len(_PHASE_SCHEDULE)
+
+@lru_cache(maxsize=None)
+def _schedule_arrays() -> tuple:
+    """
+    Build the NumPy version of the fixed time schedule and of the color tables, used to look up many ticks at once.
+
+    NumPy is imported here, so that it is only needed when looking up arrays of ticks.
+
+    Returns:
+    - tuple: the phase schedule, the north-south colors and the east-west colors, as arrays
+    """
+    import numpy as np
+    return (
+        np.array(_PHASE_SCHEDULE, dtype=np.int8),
+        np.array(_NS_COLORS, dtype=np.uint8),
+        np.array(_EW_COLORS, dtype=np.uint8),
+    )
+
 class Stoplight:
     """
     Represents the stoplight in the simulation.
 
+    The stoplight cycles through four phases (NS green, NS yellow, EW green, EW yellow):
+    green phases last until switch_yellow is called, yellow phases last YELLOW_DURATION ticks.
+
     Attributes:
     - color_NS: color of the north-south direction
     - color_EW: color of the east-west direction
@@ -15,33 +61,40 @@ class Stoplight:
 
     Constants:
     - YELLOW_DURATION: duration of the yellow light in ticks
+    - GREEN_DURATION: duration of the green light in ticks when running with fixed time
+    - PERIOD: duration of a full fixed time cycle in ticks
     """
-    YELLOW_DURATION = 90  # ticks
+    YELLOW_DURATION = _YELLOW_DURATION  # ticks
+    GREEN_DURATION = _GREEN_DURATION  # ticks
+    PERIOD = _PERIOD  # ticks
 
     def __init__(self):
-        # generate random color for north-south direction:
-        self.color_NS = TrafficLightColor.GREEN.value if random.choice([True, False]) else TrafficLightColor.RED.value
-        # set the opposite color for east-west direction:
-        self.color_EW = TrafficLightColor.RED.value if self.color_NS == TrafficLightColor.GREEN.value else TrafficLightColor.GREEN.value
+        # generate random green direction, the opposite one is red:
+        self._phase = _NS_GREEN if random.choice([True, False]) else _EW_GREEN
 
         self.time_yellow = 0
         self.time_green = 0
 
+    @property
+    def color_NS(self):
+        return _NS_COLORS[self._phase]
+
+    @property
+    def color_EW(self):
+        return _EW_COLORS[self._phase]
+
     def get_ns_color(self):
-        return self.color_NS
+        return _NS_COLORS[self._phase]
     
     def get_ew_color(self):
-        return self.color_EW
+        return _EW_COLORS[self._phase]
 
     def switch_yellow(self):
         """
         Switch the stoplight that is green to yellow.
         """
-        if self.color_NS == TrafficLightColor.GREEN.value:
-            self.color_NS = TrafficLightColor.YELLOW.value
-            self.time_green = 0
-        elif self.color_EW == TrafficLightColor.GREEN.value:
-            self.color_EW = TrafficLightColor.YELLOW.value
+        if self._phase not in _YELLOW_PHASES:
+            self._phase = _NEXT_PHASE[self._phase]
             self.time_green = 0
 
     def update_stoplight(self):
@@ -50,16 +103,40 @@ class Stoplight:
 
         Update the color of the yellow stoplight when the yellow light duration is reached.
         """
-        if self.color_NS == TrafficLightColor.GREEN.value or self.color_EW == TrafficLightColor.GREEN.value:
-            self.time_green += 1
-        if self.color_NS == TrafficLightColor.YELLOW.value or self.color_EW == TrafficLightColor.YELLOW.value:
+        if self._phase in _YELLOW_PHASES:
             self.time_yellow += 1
+            if self.time_yellow >= Stoplight.YELLOW_DURATION:
+                self._phase = _NEXT_PHASE[self._phase]
+                self.time_yellow = 0
+        else:
+            self.time_green += 1
+
+    def colors_at(self, t):
+        """
+        Get the colors of the stoplight t ticks from now, assuming it keeps running with fixed time.
+
+        Parameters:
+        - t: int, or array of ints (requires NumPy), representing the number of ticks from now
 
-        if self.time_yellow >= Stoplight.YELLOW_DURATION:
-            if self.color_NS == TrafficLightColor.YELLOW.value:
-                self.color_NS = TrafficLightColor.RED.value
-                self.color_EW = TrafficLightColor.GREEN.value
-            elif self.color_EW == TrafficLightColor.YELLOW.value:
-                self.color_EW = TrafficLightColor.RED.value
-                self.color_NS = TrafficLightColor.GREEN.value
-            self.time_yellow = 0
\ No newline at end of file
+        Returns:
+        - tuple: the colors of the north-south and east-west directions. For an int they are color tuples,
+          like get_ns_color and get_ew_color; for an array they are uint8 arrays of shape t.shape + (4,)
+        """
+        if isinstance(t, Integral):
+            phase = _PHASE_SCHEDULE[(self._cycle_position() + t) % _PERIOD]
+            return _NS_COLORS[phase], _EW_COLORS[phase]
+
+        schedule, ns_colors, ew_colors = _schedule_arrays()
+        phases = schedule[(self._cycle_position() + t) % _PERIOD]
+        return ns_colors[phases], ew_colors[phases]
+
+    def _cycle_position(self) -> int:
+        """
+        Get the tick of the fixed time cycle matching the current state of the stoplight.
+
+        Returns:
+        - int: the position in the fixed time cycle
+        """
+        elapsed = self.time_yellow if self._phase in _YELLOW_PHASES else self.time_green
+        # A green light held longer than in fixed time is mapped to the last tick of its phase
+        return _PHASE_STARTS[self._phase] + min(elapsed, _PHASE_DURATIONS[self._phase] - 1)